@@ -26,6 +26,10 @@ class AccountsService:
                 "test@testbrand.com", "+00 12 3456 789"),
         Account("c1d415ed-0d22-4fed-8235-c76e9d69be17", Account.TYPE_USER, "Test User",
                 "testuser@gmail.com", "+00 98 7654 321"),
+        Account("5b0f2e8a-3c1d-4e7b-9a26-d84f13c7b590", Account.TYPE_BRAND, "Rate Limit Test Brand",
+                "test@ratelimitbrand.com", "+00 12 3456 780"),
+        Account("9e7c4a12-6f38-4b5d-a0e1-27c9d3f6b841", Account.TYPE_USER, "Rate Limit Test User",
+                "ratelimituser@gmail.com", "+00 98 7654 320"),
     ]
 
     @classmethod
@@ -0,0 +1,113 @@
+"""Module containing code for rate limiting requests and shedding excess load."""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Class for representing a token bucket which refills continuously up to capacity."""
+
+    def __init__(self, capacity, refill_rate, now):
+        """Create a full bucket of `capacity` tokens, refilling at `refill_rate` tokens/second."""
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = now
+
+    def consume(self, cost, now):
+        """Take `cost` tokens from the bucket and return 0 if there are enough available.
+
+        Otherwise no tokens are taken, and the seconds until there will be enough is returned.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0
+        return (cost - self.tokens) / self.refill_rate
+
+
+class RateLimiter:
+    """Class for limiting how much work each account can request per period of time.
+
+    Each account gets its own TokenBucket, so checking a request is O(1) regardless of
+    how many accounts are being limited.
+    """
+
+    def __init__(self, limit, period, time_source=time.monotonic):
+        """Create a rate limiter allowing each account `limit` units of work per `period` secs."""
+        self.limit = limit
+        self.period = period
+        self.time_source = time_source
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def consume(self, account_id, cost=1):
+        """Charge the given account `cost` units of work.
+
+        Raises RateLimitExceededError if the account does not have enough budget remaining.
+        """
+        if cost <= 0:
+            raise ValueError(f"Cost {cost} must be greater than 0.")
+        if cost > self.limit:
+            raise ValueError(f"Cost {cost} exceeds the limit of {self.limit} per {self.period}s.")
+        with self.lock:
+            now = self.time_source()
+            bucket = self.buckets.get(account_id)
+            if bucket is None:
+                refill_rate = self.limit / self.period
+                bucket = self.buckets[account_id] = TokenBucket(self.limit, refill_rate, now)
+            wait_time = bucket.consume(cost, now)
+        if wait_time:
+            raise RateLimitExceededError(f"Account '{account_id}' has exceeded its rate limit.",
+                                         retry_after=math.ceil(wait_time))
+
+
+class LoadShedder:
+    """Class for rejecting requests outright when too many are already being processed."""
+
+    def __init__(self, max_in_flight, retry_after=1):
+        """Create a load shedder allowing at most `max_in_flight` requests to be processed."""
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def admit(self):
+        """Context manager counting a request as in flight for its duration.
+
+        Raises ServerOverloadedError if the maximum number of requests are already in flight.
+        """
+        with self.lock:
+            if self.in_flight >= self.max_in_flight:
+                raise ServerOverloadedError(f"{self.in_flight} requests are already in flight.",
+                                            retry_after=self.retry_after)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class AdmissionError(ValueError):
+    """Base exception for use when a request cannot be admitted for processing right now."""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitExceededError(AdmissionError):
+    """Exception for use when an account has used up its budget for a rate limited action."""
+
+
+class ServerOverloadedError(AdmissionError):
+    """Exception for use when too many requests are already being processed."""
+
+
+# Shared between endpoints to bound how many requests work on the data stores concurrently.
+STORE_LOAD_SHEDDER = LoadShedder(max_in_flight=32)
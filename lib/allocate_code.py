@@ -7,6 +7,8 @@ from marshmallow import Schema, fields
 from lib.accounts_service import AccountsService, Account
 from lib.authorization_service import AuthorizationService, InvalidTokenError
 from lib.discount_code import DiscountCodesDataStore, UserCodesDataStore, DiscountCodeNotFound
+from lib.admission_control import (RateLimiter, RateLimitExceededError, ServerOverloadedError,
+                                   STORE_LOAD_SHEDDER)
 
 
 class AllocateCode(Resource):
@@ -18,13 +20,18 @@ class AllocateCode(Resource):
 
     POST_REQUEST_SCHEMA = PostRequestSchema()
 
+    RATE_LIMITER = RateLimiter(limit=60, period=60)  # Allocation requests per user per minute
+
     def post(self):
         """Request generation of new discount codes."""
         errors = self.POST_REQUEST_SCHEMA.validate(request.json)
         if errors:
             message = "Bad Request."
             for error in errors:
-                message += f" Unknown field '{error}'."
+                if error in self.POST_REQUEST_SCHEMA.declared_fields:
+                    message += f" Invalid value for field '{error}'."
+                else:
+                    message += f" Unknown field '{error}'."
             abort(400, message=message)
 
         expected_fields = self.POST_REQUEST_SCHEMA.declared_fields.keys()
@@ -48,7 +55,20 @@ class AllocateCode(Resource):
             message = "Your account does not have permission to perform the requested action."
             abort(403, message=message)
 
-        brand_id = request.json["brand_id"]
+        try:
+            with STORE_LOAD_SHEDDER.admit():
+                self.RATE_LIMITER.consume(account_id)
+                return self.allocate(account_id, request.json["brand_id"])
+        except RateLimitExceededError as error:
+            message = "Too Many Requests. Code allocation limit exceeded."
+            return {"message": message}, 429, {"Retry-After": str(error.retry_after)}
+        except ServerOverloadedError as error:
+            message = "Service Unavailable. The server is overloaded."
+            return {"message": message}, 503, {"Retry-After": str(error.retry_after)}
+
+    @staticmethod
+    def allocate(account_id, brand_id):
+        """Allocate a code from the given brand to the given account and return the response."""
         try:
             discount_code = UserCodesDataStore.find_code(account_id, brand_id)
         except DiscountCodeNotFound:
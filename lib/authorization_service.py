@@ -10,6 +10,7 @@ class AuthorizationService:
     BEARER_TOKENS = {   # Fake tokens
         "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9": "1ec1e6bc-7906-4859-8edc-eddf6185ced8",
         "Bearer SflKxwRJSMeKKF2QT4fwpMeJf36POk6yJVQa": "c1d415ed-0d22-4fed-8235-c76e9d69be17",
+        "Bearer MjM5MDIyfQSflKxwRJSMeKKF2QT4fwpMeJf3": "9e7c4a12-6f38-4b5d-a0e1-27c9d3f6b841",
     }
 
     @classmethod
@@ -7,6 +7,8 @@ from marshmallow import Schema, fields
 from lib.accounts_service import AccountsService, Account
 from lib.authorization_service import AuthorizationService, InvalidTokenError
 from lib.discount_code import DiscountCode, DiscountCodesDataStore
+from lib.admission_control import (RateLimiter, RateLimitExceededError, ServerOverloadedError,
+                                   STORE_LOAD_SHEDDER)
 
 
 class GenerateCodes(Resource):
@@ -14,17 +16,22 @@ class GenerateCodes(Resource):
 
     class PostRequestSchema(Schema):
         """Schema for validating parameters in POST requests to the endpoint."""
-        quantity = fields.Int()
+        quantity = fields.Int(strict=True)
 
     POST_REQUEST_SCHEMA = PostRequestSchema()
 
+    RATE_LIMITER = RateLimiter(limit=1000, period=60)  # Codes generated per brand per minute
+
     def post(self):
         """Request generation of new discount codes."""
         errors = self.POST_REQUEST_SCHEMA.validate(request.json)
         if errors:
             message = "Bad Request."
             for error in errors:
-                message += f" Unknown field '{error}'."
+                if error in self.POST_REQUEST_SCHEMA.declared_fields:
+                    message += f" Invalid value for field '{error}'."
+                else:
+                    message += f" Unknown field '{error}'."
             abort(400, message=message)
 
         expected_fields = self.POST_REQUEST_SCHEMA.declared_fields.keys()
@@ -48,6 +55,23 @@ class GenerateCodes(Resource):
             message = "Your account does not have permission to perform the requested action."
             abort(403, message=message)
 
-        for _ in range(request.json["quantity"]):
-            DiscountCodesDataStore.add_discount_code(DiscountCode(account_id))
+        return self.generate(account_id, request.json["quantity"])
+
+    def generate(self, account_id, quantity):
+        """Generate `quantity` discount codes for the given brand and return the response."""
+        if not 1 <= quantity <= self.RATE_LIMITER.limit:
+            message = f"Bad Request. 'quantity' must be between 1 and {self.RATE_LIMITER.limit}."
+            abort(400, message=message)
+
+        try:
+            with STORE_LOAD_SHEDDER.admit():
+                self.RATE_LIMITER.consume(account_id, quantity)
+                for _ in range(quantity):
+                    DiscountCodesDataStore.add_discount_code(DiscountCode(account_id))
+        except RateLimitExceededError as error:
+            message = "Too Many Requests. Code generation limit exceeded."
+            return {"message": message}, 429, {"Retry-After": str(error.retry_after)}
+        except ServerOverloadedError as error:
+            message = "Service Unavailable. The server is overloaded."
+            return {"message": message}, 503, {"Retry-After": str(error.retry_after)}
         return {}, 200
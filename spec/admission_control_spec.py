@@ -0,0 +1,74 @@
+"""File containing unit tests for the rate limiting and load shedding of requests."""
+# pylint: disable=invalid-name,line-too-long
+
+from spec.helper import *
+
+from lib.admission_control import RateLimiter, RateLimitExceededError, LoadShedder, ServerOverloadedError
+
+
+class FakeClock:
+    """Class for representing a clock whose time only moves when told to."""
+
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+def admit_request(shedder):
+    """Pass a request which does nothing through the given load shedder."""
+    with shedder.admit():
+        pass
+
+
+with description("RateLimiter"):
+    with it("should allow an account to use its whole budget at once"):
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=FakeClock())
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 10)).not_to(raise_error(RateLimitExceededError))
+
+    with it("should reject a request exceeding an account's remaining budget with a retry_after"):
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=FakeClock())
+        rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 8)
+        try:
+            rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 5)
+        except RateLimitExceededError as error:
+            expect(error.retry_after).to(equal(18))
+        else:
+            raise AssertionError("RateLimitExceededError was not raised.")
+
+    with it("should refill an account's budget over time"):
+        clock = FakeClock()
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=clock)
+        rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 10)
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID)).to(raise_error(RateLimitExceededError))
+        clock.time += 6
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID)).not_to(raise_error(RateLimitExceededError))
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID)).to(raise_error(RateLimitExceededError))
+
+    with it("should limit each account separately"):
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=FakeClock())
+        rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 10)
+        expect(lambda: rate_limiter.consume(TEST_USER_ACCOUNT_ID, 10)).not_to(raise_error(RateLimitExceededError))
+
+    with it("should raise a ValueError for a request costing more than the whole budget"):
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=FakeClock())
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 11)).to(raise_error(ValueError))
+
+    with it("should raise a ValueError for a request costing nothing or a negative amount"):
+        rate_limiter = RateLimiter(limit=10, period=60, time_source=FakeClock())
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, 0)).to(raise_error(ValueError))
+        expect(lambda: rate_limiter.consume(TEST_BRAND_ACCOUNT_ID, -5)).to(raise_error(ValueError))
+
+
+with description("LoadShedder"):
+    with it("should reject requests once the maximum number are in flight"):
+        load_shedder = LoadShedder(max_in_flight=1)
+        with load_shedder.admit():
+            expect(lambda: admit_request(load_shedder)).to(raise_error(ServerOverloadedError))
+
+    with it("should admit requests again once in flight requests have finished"):
+        load_shedder = LoadShedder(max_in_flight=1)
+        admit_request(load_shedder)
+        expect(lambda: admit_request(load_shedder)).not_to(raise_error(ServerOverloadedError))
+        expect(load_shedder.in_flight).to(equal(0))
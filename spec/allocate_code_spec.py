@@ -87,6 +87,20 @@ with description("/allocate-code"):
             expect(response.json()).to(equal({"message": expected_message}))
             expect(search_for_user_code).to(raise_error(DiscountCodeNotFound))
 
+    with context("rate limited POST requests"):
+        with it("should return a 429 with a Retry-After header once a user has used up their budget"):
+            json = {
+                "brand_id": RATE_LIMIT_TEST_BRAND_ACCOUNT_ID,
+            }
+            for _ in range(61):
+                response = requests.post(ENDPOINT_URL, headers=RATE_LIMIT_TEST_USER_AUTHORIZATION_HEADERS, json=json)
+                if response.status_code != 200:
+                    break
+            expect(response.status_code).to(equal(429))
+            expected_message = "Too Many Requests. Code allocation limit exceeded."
+            expect(response.json()).to(equal({"message": expected_message}))
+            test_retry_after_header_is_valid(response)
+
     with context("invalid POST requests"):
         with it("should not allocate a code for an authorized request from a brand account"):
             clear_test_codes_from_data_store()
@@ -74,3 +74,37 @@ with description("/generate-codes"):
             expected_message = "Bad Request. Unknown field 'planet'."
             expect(response.json()).to(equal({"message": expected_message}))
             expect(len(get_all_test_brand_codes())).to(equal(0))
+
+        with it("should return an appropriate 400 message if 'quantity' is not a positive number"):
+            clear_test_codes_from_data_store()
+            json = {
+                "quantity": 0,
+            }
+            response = requests.post(ENDPOINT_URL, headers=TEST_BRAND_AUTHORIZATION_HEADERS, json=json)
+            expect(response.status_code).to(equal(400))
+            expected_message = "Bad Request. 'quantity' must be between 1 and 1000."
+            expect(response.json()).to(equal({"message": expected_message}))
+            expect(len(get_all_test_brand_codes())).to(equal(0))
+
+        with it("should return an appropriate 400 message if 'quantity' exceeds the rate limit"):
+            clear_test_codes_from_data_store()
+            json = {
+                "quantity": 1001,
+            }
+            response = requests.post(ENDPOINT_URL, headers=TEST_BRAND_AUTHORIZATION_HEADERS, json=json)
+            expect(response.status_code).to(equal(400))
+            expected_message = "Bad Request. 'quantity' must be between 1 and 1000."
+            expect(response.json()).to(equal({"message": expected_message}))
+            expect(len(get_all_test_brand_codes())).to(equal(0))
+
+        with it("should return an appropriate 400 message if 'quantity' is not an integer"):
+            clear_test_codes_from_data_store()
+            for quantity in ["5", 5.0]:
+                json = {
+                    "quantity": quantity,
+                }
+                response = requests.post(ENDPOINT_URL, headers=TEST_BRAND_AUTHORIZATION_HEADERS, json=json)
+                expect(response.status_code).to(equal(400))
+                expected_message = "Bad Request. Invalid value for field 'quantity'."
+                expect(response.json()).to(equal({"message": expected_message}))
+            expect(len(get_all_test_brand_codes())).to(equal(0))